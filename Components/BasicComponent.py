@@ -1,9 +1,10 @@
 from enum import Enum
+from functools import cached_property, lru_cache, wraps
 from time import sleep
 from typing import Optional, Union, List, Tuple, Any
 
 from selenium.common.exceptions import ElementClickInterceptedException, TimeoutException, \
-    ElementNotInteractableException
+    ElementNotInteractableException, NoSuchElementException, StaleElementReferenceException
 from selenium.webdriver import ActionChains
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
@@ -11,6 +12,7 @@ from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support import expected_conditions as ec
 from selenium.webdriver.support.ui import WebDriverWait
 
+from Helpers.AdaptiveWait import AdaptiveWait
 from Helpers.CSSEnumerations import CSSPropertyValue
 from Helpers.IAExpectedConditions import IAExpectedConditions as IAec
 from Helpers.IASelenium import IASelenium
@@ -18,6 +20,57 @@ from Helpers.PerspectivePages.Quality import PerspectiveQuality
 from Helpers.Point import Point
 
 
+_STALE_ELEMENT_RETRY_ATTEMPTS = 3
+_SCROLL_INTO_VIEW_SCRIPT = 'arguments[0].scrollIntoView(arguments[1]);'
+_ELEMENT_IS_CONNECTED_SCRIPT = 'return arguments[0].isConnected;'
+
+
+def retry_on_stale_element(call):
+    """
+    Retry a ComponentPiece method in the event the Web Element backing the component has gone stale in the DOM.
+    Each retry clears the cached Web Element of the component so that the next attempt re-locates the element
+    instead of re-using a dead reference. The final attempt allows the StaleElementReferenceException to be raised.
+    """
+    @wraps(call)
+    def wrapper(self, *args, **kwargs):
+        for attempt in range(_STALE_ELEMENT_RETRY_ATTEMPTS):
+            try:
+                return call(self, *args, **kwargs)
+            except StaleElementReferenceException:
+                self._cached_element = None
+                if attempt == _STALE_ELEMENT_RETRY_ATTEMPTS - 1:
+                    raise
+    # functools.wraps sets __wrapped__, which introspection tools follow to recover the original signature, so
+    # no eager (and slow) inspect.signature copy is required at decoration time.
+    return wrapper
+
+
+class _SelfHealingElement(WebElement):
+    """
+    A cached Web Element which re-locates itself through its owning ComponentPiece when it goes stale.
+
+    :func:`ComponentPiece.find` hands out cached references, but the DOM of a Perspective session re-renders
+    routinely, and call sites throughout the tree invoke element commands directly on the returned handle - with
+    no opportunity for the component to intercept a StaleElementReferenceException. Routing every element command
+    through this wrapper lets a stale reference invalidate the cache and transparently retry against a freshly
+    located element, so callers observe the same behavior an uncached lookup would have provided. A reference
+    which is stale even after re-location raises as normal.
+    """
+
+    def __init__(self, owner: "ComponentPiece", element: WebElement):
+        super().__init__(element.parent, element.id)
+        self._owner = owner
+
+    def _execute(self, command, params=None):
+        try:
+            return super()._execute(command, params)
+        except StaleElementReferenceException:
+            self._owner.invalidate_cache()
+            # Adopt the id of the freshly located element; the base _execute re-applies self._id on retry.
+            self._id = self._owner.find().id
+            return super()._execute(command, params)
+
+
 class RequestPrintTarget(Enum):
     """
     The expected target to be supplied as a parameter to the requestPrint method available to components.
@@ -31,10 +84,26 @@ class ComponentPiece:
     """
     Component Pieces may be understood as distinct Web Elements which are actually pieces of a greater component.
     """
+    # Component Pieces proliferate - pages construct hundreds - so instances carry fixed slots instead of a
+    # per-instance __dict__. Subclasses which add attributes of their own implicitly regain a __dict__ for them.
+    __slots__ = (
+        '_locator', 'driver', 'wait_timeout', 'wait', 'description', '_cached_element', '_cached_css_locator',
+        '_cached_xpath_locator', '_cached_presence_condition', '_wait_cache', '_parent_locator_list', 'locator_list',
+        'poll_freq')
     # For use on checkboxes that are pieces of another component
     _CHECKBOX_LOCATOR = (By.CSS_SELECTOR, 'label.ia_checkbox svg')
     _CHECKBOX_CHECKED = 'ia_checkbox__checkedIcon'
     _CHECKBOX_UNCHECKED = 'ia_checkbox__uncheckedIcon'
+    # Comparators used by wait_on_text_condition, resolved once per wait instead of branching on every poll. Note
+    # that commas are stripped from both sides before NumericCondition comparators are applied.
+    _TEXT_CONDITION_COMPARATORS = {
+        IAec.TextCondition.EQUALS: lambda expected, actual: expected == actual,
+        IAec.TextCondition.DOES_NOT_EQUAL: lambda expected, actual: expected != actual,
+        IAec.TextCondition.CONTAINS: lambda expected, actual: expected in actual,
+        IAec.TextCondition.DOES_NOT_CONTAIN: lambda expected, actual: expected not in actual,
+        IAec.NumericCondition.EQUALS: lambda expected, actual: expected == actual,
+        IAec.NumericCondition.DOES_NOT_EQUAL: lambda expected, actual: expected != actual
+    }
 
     def __init__(
             self,
@@ -61,9 +130,16 @@ class ComponentPiece:
         self._locator = locator
         self.driver = driver
         self.wait_timeout = wait_timeout
-        self.wait = WebDriverWait(driver=self.driver, timeout=wait_timeout, poll_frequency=poll_freq)
+        self.wait = AdaptiveWait(driver=self.driver, timeout=wait_timeout, poll_frequency=poll_freq)
         self.description = description
-        self._parent_locator_list = parent_locator_list.copy() if parent_locator_list else []
+        self._cached_element: Optional[WebElement] = None
+        self._cached_css_locator: Optional[Tuple[Union[By, str], str]] = None
+        self._cached_xpath_locator: Optional[Tuple[Union[By, str], str]] = None
+        self._cached_presence_condition = None
+        self._wait_cache: dict = {}
+        # Locator lists are only ever replaced wholesale (never mutated in place), so the supplied list may be
+        # aliased directly instead of copied.
+        self._parent_locator_list = parent_locator_list if parent_locator_list else ()
         self._update_locator_list()
         self.poll_freq = poll_freq
 
@@ -77,12 +153,13 @@ class ComponentPiece:
 
         :raises TimeoutException: If the component is not found in the DOM.
         """
-        wait = WebDriverWait(driver=self.driver, timeout=wait_timeout) if wait_timeout is not None else self.wait
+        wait = self._wait_for(wait_timeout=wait_timeout)
         self.find(wait_timeout=wait_timeout)  # do not capture TimeoutException here
 
-        # A TimeoutException here means the element never became clickable.
+        # A TimeoutException here means the element never became clickable. _click already absorbs stale elements
+        # via retry_on_stale_element, so no expected-condition wrapper is needed around it.
         wait.until(
-            IAec.function_returns_true(custom_function=self._click, function_args={}),
+            lambda driver: self._click(),
             message="The element never became clickable.")
         self.wait_on_binding(time_to_wait=binding_wait_time)
 
@@ -106,6 +183,7 @@ class ComponentPiece:
             IASelenium(self.driver).take_screenshot_of_element(self.find())
             raise ecie
 
+    @retry_on_stale_element
     def double_click(self, binding_wait_time: float = 0) -> None:
         """
         Double-click the component.
@@ -114,7 +192,8 @@ class ComponentPiece:
 
         :raises TimeoutException: If the component is not found in the DOM.
         """
-        ActionChains(self.driver).move_to_element(to_element=self.find()).double_click(on_element=self.find()).perform()
+        element = self.find()
+        ActionChains(self.driver).move_to_element(to_element=element).double_click(on_element=element).perform()
         self.wait_on_binding(time_to_wait=binding_wait_time)
 
     def find(self, wait_timeout: Optional[Union[int, float]] = None) -> WebElement:
@@ -125,25 +204,36 @@ class ComponentPiece:
 
         :param wait_timeout: The amount of time (in seconds) to wait to locate the Web Element.
 
-        :returns: The first Web Element found given the supplied locator for this component.
+        :returns: The first Web Element found given the supplied locator for this component. Web Elements are cached
+            once located; a cache hit is verified as still attached to the DOM before being returned, so an element
+            which has been removed falls back to a fresh location attempt (and the usual TimeoutException when
+            absent). Cached references also detect their own staleness during use and transparently re-locate
+            themselves before retrying.
 
         :raises TimeoutException: If no element matches the locator of this component.
         """
-        if wait_timeout is not None:  # 0 is acceptable
-            local_wait = WebDriverWait(
-                self.driver,
-                wait_timeout)
-        else:
-            local_wait = self.wait
-        css_locator = self.get_full_css_locator()
+        if self._cached_element is not None:
+            # A cache hit must not skip the DOM entirely: many call sites use find() as a presence probe and rely
+            # on the TimeoutException once the element is gone, so confirm the cached reference is still attached
+            # before handing it out. One lightweight script call beats re-running the locator, and a detached or
+            # stale reference simply falls through to a fresh location attempt.
+            try:
+                if self.driver.execute_script(_ELEMENT_IS_CONNECTED_SCRIPT, self._cached_element):
+                    return self._cached_element
+            except (StaleElementReferenceException, NoSuchElementException):
+                pass
+            self._cached_element = None
+        local_wait = self._wait_for(wait_timeout=wait_timeout)
+        if self._cached_presence_condition is None:
+            self._cached_presence_condition = ec.presence_of_element_located(self.get_full_css_locator())
         try:
-            return local_wait.until(
-                ec.presence_of_element_located(
-                    css_locator))
+            self._cached_element = _SelfHealingElement(
+                owner=self, element=local_wait.until(self._cached_presence_condition))
+            return self._cached_element
         except TimeoutException as toe:
             description = f"\nDescription: {self.description}" if self.description else ''
             raise TimeoutException(
-                msg=f"Unable to locate element with CSS locator: {css_locator}{description}") from toe
+                msg=f"Unable to locate element with CSS locator: {self.get_full_css_locator()}{description}") from toe
 
     def find_all(self, wait_timeout: Optional[Union[int, float]] = None) -> List[WebElement]:
         """
@@ -156,10 +246,7 @@ class ComponentPiece:
 
         :raises TimeoutException: If no elements match the locator of this component.
         """
-        if wait_timeout is not None:  # 0 is acceptable
-            local_wait = WebDriverWait(self.driver, wait_timeout)
-        else:
-            local_wait = self.wait
+        local_wait = self._wait_for(wait_timeout=wait_timeout)
         css_locator = self.get_full_css_locator()
         try:
             return local_wait.until(ec.presence_of_all_elements_located(css_locator))
@@ -168,6 +255,7 @@ class ComponentPiece:
             raise TimeoutException(
                 msg=f"Unable to locate any elements with CSS locator: {css_locator}{description}") from toe
 
+    @retry_on_stale_element
     def get_computed_height(self, include_units: bool = False) -> str:
         """
         Get the computed height of the component. Must return as a string because of the possibility of included units.
@@ -179,15 +267,17 @@ class ComponentPiece:
 
         :raises TimeoutException: If the component is not found in the DOM.
         """
-        height = self.find().value_of_css_property("height")
+        element = self.find()
+        height = element.value_of_css_property("height")
         # special handling for flex containers
         if height == "auto":
             # no need to strip units here because it's always numeric
-            return self.find().rect['height']
+            return element.rect['height']
         if not include_units:
-            height = height.split("px")[0]
+            height = height.removesuffix("px")
         return height
 
+    @retry_on_stale_element
     def get_computed_width(self, include_units: bool = False) -> str:
         """
         Get the computed width of the component. Must return as a string because of the possibility of included units.
@@ -199,15 +289,17 @@ class ComponentPiece:
 
         :raises TimeoutException: If the component is not found in the DOM.
         """
-        width = self.find().value_of_css_property("width")
+        element = self.find()
+        width = element.value_of_css_property("width")
         # special handling for flex containers
         if width == "auto":
             # no need to strip units here because it's always numeric
-            return self.find().rect['width']
+            return element.rect['width']
         if not include_units:
-            width = width.split("px")[0]
+            width = width.removesuffix("px")
         return width
 
+    @retry_on_stale_element
     def get_css_property(self, property_name: Union[CSSPropertyValue, str]) -> str:
         """
         Get a CSS property value of the Web Element defined by this component.
@@ -223,20 +315,27 @@ class ComponentPiece:
 
     def get_full_css_locator(self) -> Tuple[Union[By, str], str]:
         """
-        Get the fully constructed CSS selector of this component.
+        Get the fully constructed CSS selector of this component. The constructed selector is cached until the
+        locator list of the component changes.
 
         :returns: The fully constructed CSS selector of this component.
         """
-        return _LocatorBuilder.get_css_locator(locators=self.locator_list)
+        if self._cached_css_locator is None:
+            self._cached_css_locator = _LocatorBuilder.get_css_locator(locators=self.locator_list)
+        return self._cached_css_locator
 
     def get_full_xpath_locator(self) -> Tuple[Union[By, str], str]:
         """
-        Get the fully constructed XPATH selector of this component.
+        Get the fully constructed XPATH selector of this component. The constructed selector is cached until the
+        locator list of the component changes.
 
         :returns: The fully constructed XPATH selector of this component.
         """
-        return _LocatorBuilder.get_xpath_locator(locators=self.locator_list)
+        if self._cached_xpath_locator is None:
+            self._cached_xpath_locator = _LocatorBuilder.get_xpath_locator(locators=self.locator_list)
+        return self._cached_xpath_locator
 
+    @retry_on_stale_element
     def get_origin(self) -> Point:
         """
         Get the Cartesian Coordinate of the upper-left corner of the component, measured from the
@@ -248,6 +347,7 @@ class ComponentPiece:
         rect = self.find().rect
         return Point(x=rect['x'], y=rect['y'])
 
+    @retry_on_stale_element
     def get_termination(self) -> Point:
         """
         Get the Cartesian Coordinate of the bottom-right corner of the component, measured from the
@@ -259,6 +359,7 @@ class ComponentPiece:
         rect = self.find().rect
         return Point(rect['x'] + rect['width'], rect['y'] + rect['height'])
 
+    @retry_on_stale_element
     def get_text(self) -> str:
         """
         Get the text of this component.
@@ -268,6 +369,7 @@ class ComponentPiece:
         """
         return self.find().text
 
+    @retry_on_stale_element
     def hover(self) -> None:
         """
         Hover over this component.
@@ -276,12 +378,62 @@ class ComponentPiece:
         """
         ActionChains(self.driver).move_to_element(self.find()).perform()
 
+    def invalidate_cache(self) -> None:
+        """
+        Discard the cached Web Element of this component, forcing the next interaction to re-locate the element in
+        the DOM. Useful during page transitions, where a previously located element may silently reference a node
+        which no longer exists.
+        """
+        self._cached_element = None
+
+    def is_displayed(self) -> bool:
+        """
+        Determine if the component is currently displayed. This is a single-shot probe of the DOM which does not
+        wait for the component to appear, and so avoids the polling machinery of :func:`find` entirely.
+
+        :returns: True, if the component is present in the DOM and displayed - False otherwise.
+        """
+        try:
+            return self.driver.find_element(*self.get_full_css_locator()).is_displayed()
+        except (NoSuchElementException, StaleElementReferenceException):
+            return False
+
+    def exists_now(self) -> bool:
+        """
+        Determine if the component is currently present in the DOM. This is a single-shot probe which never waits
+        and never raises, making it suitable for negative-path checks which would otherwise pay a full timeout.
+
+        :returns: True, if any element matches the locator of this component - False otherwise.
+        """
+        return bool(self.driver.find_elements(*self.get_full_css_locator()))
+
+    @staticmethod
+    def prefetch(components: List["ComponentPiece"]) -> None:
+        """
+        Locate many components in a single WebDriver round-trip, priming the Web Element cache of each. Instead of
+        one findElement command per component, one script call resolves every selector in-page. Components which are
+        not currently present in the DOM are left untouched and will be located normally on their next use.
+
+        :param components: The components to locate. All supplied components must belong to the same driver.
+        """
+        components = [component for component in components if component._cached_element is None]
+        if not components:
+            return
+        elements = components[0].driver.execute_script(
+            'return arguments[0].map(function(s) { return document.querySelector(s); });',
+            [component.get_full_css_locator()[1] for component in components])
+        for component, element in zip(components, elements):
+            if element is not None:
+                component._cached_element = _SelfHealingElement(owner=component, element=element)
+
+    @retry_on_stale_element
     def release_focus(self) -> None:
         """
         Forces a blur() event on the Web Element.
         """
         self.driver.execute_script('arguments[0].blur()', self.find())
 
+    @retry_on_stale_element
     def right_click(self, binding_wait_time: Optional[float] = 0) -> None:
         """
         Right-click this component.
@@ -293,6 +445,7 @@ class ComponentPiece:
         IASelenium(driver=self.driver).right_click(web_element=self.find())
         self.wait_on_binding(time_to_wait=binding_wait_time)
 
+    @retry_on_stale_element
     def scroll_to_element(self, align_to_top: bool = True) -> None:
         """
         Vertical scroll to this element in the viewport.
@@ -302,8 +455,7 @@ class ComponentPiece:
 
         :raises TimeoutException: If no element matches the locator of this component.
         """
-        self.driver.execute_script('arguments[0].scrollIntoView(' + str(align_to_top).lower() + ');',
-                                   self.find())
+        self.driver.execute_script(_SCROLL_INTO_VIEW_SCRIPT, self.find(), align_to_top)
 
     def set_locator(self, new_locator: Tuple[By, str]) -> None:
         """
@@ -314,6 +466,24 @@ class ComponentPiece:
         self._locator = new_locator
         self._update_locator_list()
 
+    def wait_for_idle(self, timeout: float = 0.5) -> None:
+        """
+        Wait until the document reports itself as complete and a frame has been painted, instead of sleeping for a
+        fixed period. Prefer this over :func:`wait_on_binding` when waiting on page readiness rather than on
+        Perspective bindings, as it returns as soon as the page has settled.
+
+        :param timeout: The maximum amount of time (in seconds) to wait for the page to settle.
+        """
+        self.driver.execute_async_script(
+            'const done = arguments[arguments.length - 1];'
+            'setTimeout(done, arguments[0] * 1000);'
+            'if (document.readyState === "complete") {'
+            '    requestAnimationFrame(() => requestAnimationFrame(() => done()));'
+            '} else {'
+            '    window.addEventListener("load", () => done(), {once: true});'
+            '}',
+            timeout)
+
     def wait_on_text_condition(
             self,
             text_to_compare: Optional[Any],
@@ -332,8 +502,14 @@ class ComponentPiece:
 
         :returns: The text of the Component, after potentially having waited for an expected text match.
         """
-        cond_wait = WebDriverWait(driver=self.driver, timeout=wait_timeout) if wait_timeout is not None else self.wait
+        cond_wait = self._wait_for(wait_timeout=wait_timeout)
         text_to_compare = str(text_to_compare) if text_to_compare is not None else text_to_compare
+        is_numeric_condition = isinstance(condition, IAec.NumericCondition)
+        if is_numeric_condition and text_to_compare is not None:
+            text_to_compare = text_to_compare.replace(",", "")
+        comparator = self._TEXT_CONDITION_COMPARATORS.get(condition)
+        if comparator is None and text_to_compare is not None:
+            raise NotImplementedError("Unhandled condition while comparing text.")
         text = ""
 
         def compare_against_condition():
@@ -342,36 +518,24 @@ class ComponentPiece:
             to safeguard against StaleElementReferenceExceptions.
 
             :return: True, if the text of the Component satisfies the specified condition - False otherwise.
-
-            :raises NotImplementError: If the specified condition is not supported.
             """
             nonlocal text
-            nonlocal text_to_compare
             try:
                 text = self.get_text()
             except TimeoutException as get_text_toe:
                 get_text_toe.should_raise = True  # toe from failing to locate the component/element should be raised
                 raise
+            except StaleElementReferenceException:
+                # get_text is overridden without retry_on_stale_element in several components, so treat a stale
+                # read as an unmet condition and allow the wait to re-poll.
+                return False
             if text_to_compare is None:
                 # immediately return because the text will NEVER compare correctly against None
                 return text
-            if condition == IAec.TextCondition.EQUALS:
-                return text_to_compare == text
-            elif condition == IAec.TextCondition.DOES_NOT_EQUAL:
-                return text_to_compare != text
-            elif condition == IAec.TextCondition.CONTAINS:
-                return text_to_compare in text
-            elif condition == IAec.TextCondition.DOES_NOT_CONTAIN:
-                return text_to_compare not in text
-            elif condition == IAec.NumericCondition.EQUALS:
-                return str(text_to_compare).replace(",", "") == str(text).replace(",", "")
-            elif condition == IAec.NumericCondition.DOES_NOT_EQUAL:
-                return str(text_to_compare).replace(",", "") != str(text).replace(",", "")
-            else:
-                raise NotImplementedError("Unhandled condition while comparing text.")
+            return comparator(text_to_compare, str(text).replace(",", "") if is_numeric_condition else text)
 
         try:
-            cond_wait.until(IAec.function_returns_true(custom_function=compare_against_condition, function_args={}))
+            cond_wait.until(lambda driver: compare_against_condition())
         except TimeoutException as toe:
             if getattr(toe, 'should_raise', False):
                 raise  # due to failing to find the component/element
@@ -388,10 +552,7 @@ class ComponentPiece:
 
         :raises TimeoutException: If no element matches the locator of this component.
         """
-        if wait_timeout:
-            local_wait = WebDriverWait(self.driver, wait_timeout)
-        else:
-            local_wait = self.wait
+        local_wait = self._wait_for(wait_timeout=wait_timeout)
         xpath_locator = self.get_full_xpath_locator()
         try:
             return local_wait.until(ec.presence_of_element_located(xpath_locator))
@@ -409,10 +570,7 @@ class ComponentPiece:
 
         :raises TimeoutException: If no element matches the locator of this component.
         """
-        if wait_timeout:
-            local_wait = WebDriverWait(self.driver, wait_timeout)
-        else:
-            local_wait = self.wait
+        local_wait = self._wait_for(wait_timeout=wait_timeout)
         xpath_locator = self.get_full_xpath_locator()
         try:
             return local_wait.until(ec.presence_of_all_elements_located(xpath_locator))
@@ -429,8 +587,10 @@ class ComponentPiece:
 
         :param time_to_wait: The amount of time (in seconds) to wait.
         """
-        sleep(time_to_wait)
+        if time_to_wait > 0:
+            sleep(time_to_wait)
 
+    @retry_on_stale_element
     def _click(self) -> bool:
         """
         Attempt to click an item, and continue attempting to do so until the item becomes "interactable".
@@ -446,6 +606,25 @@ class ComponentPiece:
         except ElementNotInteractableException:
             return False
 
+    def _wait_for(self, wait_timeout: Optional[Union[int, float]]) -> WebDriverWait:
+        """
+        Get a WebDriverWait which polls the DOM for the supplied amount of time. Waits are memoized per-timeout so
+        that repeated lookups which use the same timeout do not construct a new WebDriverWait on every call.
+
+        :param wait_timeout: The amount of time (in seconds) the returned wait will poll the DOM. A value of None
+            returns the default wait of the component.
+
+        :returns: A WebDriverWait which polls the DOM for the supplied amount of time.
+        """
+        if wait_timeout is None:
+            return self.wait
+        local_wait = self._wait_cache.get(wait_timeout)
+        if local_wait is None:
+            local_wait = AdaptiveWait(driver=self.driver, timeout=wait_timeout, poll_frequency=self.poll_freq)
+            self._wait_cache[wait_timeout] = local_wait
+        return local_wait
+
+    @retry_on_stale_element
     def _has_text(self, text: str) -> bool:
         """
         Used to determine if a Web Element currently has the exact supplied text.
@@ -462,18 +641,27 @@ class ComponentPiece:
         """
         if self._parent_locator_list:
             # Used for subcomponents
-            self.locator_list = self._parent_locator_list.copy()
             if self._locator:
-                self.locator_list.append(self._locator)
+                locator_list = (*self._parent_locator_list, self._locator)
+            else:
+                locator_list = tuple(self._parent_locator_list)
         else:
-            self.locator_list = [self._locator]
+            locator_list = (self._locator,)
+        if locator_list == getattr(self, "locator_list", None):
+            # nothing changed, so any cached element/selectors remain valid
+            return
+        self.locator_list = locator_list
+        self._cached_element = None
+        self._cached_css_locator = None
+        self._cached_xpath_locator = None
+        self._cached_presence_condition = None
 
 
 class BasicComponent(ComponentPiece):
     """
     A BasicComponent is analogous to a Web Element, albeit with custom wrapping and convenience methods.
     """
-    pass
+    __slots__ = ()
 
 
 class BasicPerspectiveComponent(BasicComponent):
@@ -521,47 +709,71 @@ class BasicPerspectiveComponent(BasicComponent):
             wait_timeout=wait_timeout,
             description=description,
             poll_freq=poll_freq)
-        self._quality_overlay_state_div = ComponentPiece(
+
+    # The quality overlay pieces are cached properties instead of eager constructions because most instances never
+    # consult the quality overlay at all.
+
+    @cached_property
+    def _quality_overlay_state_div(self) -> ComponentPiece:
+        return ComponentPiece(
             locator=self._QUALITY_OVERLAY_STATE_DIV_LOCATOR,
-            driver=driver,
+            driver=self.driver,
             parent_locator_list=self.locator_list,
             wait_timeout=1,
-            poll_freq=poll_freq)
-        self._quality_overlay_footer = ComponentPiece(
+            poll_freq=self.poll_freq)
+
+    @cached_property
+    def _quality_overlay_footer(self) -> ComponentPiece:
+        return ComponentPiece(
             locator=self._QUALITY_OVERLAY_FOOTER_LOCATOR,
-            driver=driver,
+            driver=self.driver,
             parent_locator_list=self._quality_overlay_state_div.locator_list,
             wait_timeout=0,
-            poll_freq=poll_freq)
-        self._quality_overlay_header = ComponentPiece(
+            poll_freq=self.poll_freq)
+
+    @cached_property
+    def _quality_overlay_header(self) -> ComponentPiece:
+        return ComponentPiece(
             locator=self._QUALITY_OVERLAY_HEADER_LOCATOR,
-            driver=driver,
+            driver=self.driver,
             parent_locator_list=self._quality_overlay_state_div.locator_list,
             wait_timeout=0,
-            poll_freq=poll_freq)
-        self._header_popover_badges = ComponentPiece(
+            poll_freq=self.poll_freq)
+
+    @cached_property
+    def _header_popover_badges(self) -> ComponentPiece:
+        return ComponentPiece(
             locator=self._HEADER_POPOVER_ICON_LOCATOR,
-            driver=driver,
+            driver=self.driver,
             parent_locator_list=self._quality_overlay_header.locator_list,
             wait_timeout=0,
-            poll_freq=poll_freq)
-        self._micro_overlay_icons = ComponentPiece(
+            poll_freq=self.poll_freq)
+
+    @cached_property
+    def _micro_overlay_icons(self) -> ComponentPiece:
+        return ComponentPiece(
             locator=self._MICRO_OVERLAY_ICON_LOCATOR,
-            driver=driver,
+            driver=self.driver,
             parent_locator_list=self._quality_overlay_footer.locator_list,
             wait_timeout=0,
-            poll_freq=poll_freq)
-        self._quality_popover = ComponentPiece(
+            poll_freq=self.poll_freq)
+
+    @cached_property
+    def _quality_popover(self) -> ComponentPiece:
+        return ComponentPiece(
             locator=self._POPOVER_LOCATOR,
-            driver=driver,
+            driver=self.driver,
             parent_locator_list=None,
             wait_timeout=1,
-            poll_freq=poll_freq)
-        self._quality_popover_subsections = ComponentPiece(
+            poll_freq=self.poll_freq)
+
+    @cached_property
+    def _quality_popover_subsections(self) -> ComponentPiece:
+        return ComponentPiece(
             locator=self._POPOVER_SUBSECTION_LOCATOR,
-            driver=driver,
+            driver=self.driver,
             parent_locator_list=self._quality_popover.locator_list,
-            poll_freq=poll_freq)
+            poll_freq=self.poll_freq)
 
     def click_quality_overlay_popover_icon(self) -> None:
         """
@@ -569,7 +781,7 @@ class BasicPerspectiveComponent(BasicComponent):
 
         This click occurs every time because there is no way to know what component any open popover belongs to.
         """
-        if self.quality_overlay_is_in_micro_mode():
+        if self._read_overlay_state()['micro']:
             # fallback to "first"
             self._micro_overlay_icons.click(binding_wait_time=0.1)
         else:
@@ -584,7 +796,7 @@ class BasicPerspectiveComponent(BasicComponent):
         :raises IndexError: If the component is not inside a Column Container.
         :raises TimeoutException: If no element matches the locator of this component.
         """
-        return int(self.find().value_of_css_property('grid-column-end').split('span ')[1])
+        return int(self._get_grid_column_properties()['grid-column-end'].split('span ')[1])
 
     def get_display_column(self) -> int:
         """
@@ -596,7 +808,7 @@ class BasicPerspectiveComponent(BasicComponent):
         :raises IndexError: If the component is not inside a Column Container.
         :raises TimeoutException: If no element matches the locator of this component.
         """
-        return int(self.find().value_of_css_property(property_name="grid-column").split(" / span")[0])
+        return int(self._get_grid_column_properties()['grid-column'].split(" / span")[0])
 
     def get_display_row(self) -> int:
         """
@@ -607,7 +819,8 @@ class BasicPerspectiveComponent(BasicComponent):
         :raises IndexError: If the component is not inside a Column Container.
         :raises TimeoutException: If no element matches the locator of this component.
         """
-        return int(self.find().find_element(By.XPATH, "..").get_attribute("data-row-index"))
+        return int(self.driver.execute_script(
+            'return arguments[0].parentElement.getAttribute("data-row-index");', self.find()))
 
     def get_display_span(self) -> int:
         """
@@ -620,6 +833,7 @@ class BasicPerspectiveComponent(BasicComponent):
         """
         return int(self.find().value_of_css_property(property_name="span"))
 
+    @retry_on_stale_element
     def get_origin_within_coordinate_parent(self) -> Point:
         """
         Get the origin of the component within its parent Coordinate Container. Distinct from get_origin which provides
@@ -629,11 +843,9 @@ class BasicPerspectiveComponent(BasicComponent):
 
         :raises TimeoutException: If no element matches the locator of this component.
         """
-        left = self.find().value_of_css_property('left')
-        top = self.find().value_of_css_property('top')
-        left = left.split("px")[0]
-        top = top.split("px")[0]
-        return Point(x=float(left), y=float(top))
+        left, top = self.driver.execute_script(
+            'const style = getComputedStyle(arguments[0]); return [style.left, style.top];', self.find())
+        return Point(x=float(left.removesuffix("px")), y=float(top.removesuffix("px")))
 
     def get_quality_overlay_footer_text(self) -> str:
         """
@@ -653,8 +865,7 @@ class BasicPerspectiveComponent(BasicComponent):
 
         :raises TimeoutException: If the component has no Quality Overlay, or if the Quality Overlay is in Micro mode.
         """
-        self.click_quality_overlay_popover_icon()
-        return self._quality_popover_subsections.find_all()[self._POPOVER_DESCRIPTION_INDEX].text
+        return self._get_all_popover_texts()[self._POPOVER_DESCRIPTION_INDEX]
 
     def get_quality_popover_property(self) -> str:
         """
@@ -664,8 +875,7 @@ class BasicPerspectiveComponent(BasicComponent):
 
         :raises TimeoutException: If the component has no Quality Overlay, or if the Quality Overlay is in Micro mode.
         """
-        self.click_quality_overlay_popover_icon()
-        return self._quality_popover_subsections.find_all()[self._POPOVER_PROPERTY_INDEX].text
+        return self._get_all_popover_texts()[self._POPOVER_PROPERTY_INDEX]
 
     def get_quality_popover_subcode(self) -> str:
         """
@@ -675,8 +885,7 @@ class BasicPerspectiveComponent(BasicComponent):
 
         :raises TimeoutException: If the component has no Quality Overlay, or if the Quality Overlay is in Micro mode.
         """
-        self.click_quality_overlay_popover_icon()
-        return self._quality_popover_subsections.find_all()[self._POPOVER_SUBCODE_INDEX].text
+        return self._get_all_popover_texts()[self._POPOVER_SUBCODE_INDEX]
 
     def is_in_percent_mode(self) -> bool:
         """
@@ -701,13 +910,16 @@ class BasicPerspectiveComponent(BasicComponent):
         :param quality: The quality status to check for that is present on the quality overlay of this component.
         """
         if self.quality_overlay_is_in_micro_mode():
-            targets = self._micro_overlay_icons.find_all()
+            icons = self._micro_overlay_icons
         else:
-            targets = self._header_popover_badges.find_all()
-        for target in targets:
-            if quality.value in target.get_attribute("class"):
-                return target.is_displayed()
-        return False
+            icons = self._header_popover_badges
+        # filter the icons in-page instead of round-tripping per icon for the class attribute and displayed state
+        return self.driver.execute_script(
+            'const match = Array.from(document.querySelectorAll(arguments[0]))'
+            '    .find(e => (e.getAttribute("class") || "").includes(arguments[1]));'
+            'return match ? match.getClientRects().length > 0 : false;',
+            icons.get_full_css_locator()[1],
+            quality.value)
 
     def quality_overlay_footer_text_is_displayed(self) -> bool:
         """
@@ -715,10 +927,10 @@ class BasicPerspectiveComponent(BasicComponent):
 
         :returns: True, if quality overlay is present - False otherwise.
         """
-        try:
-            return len(self.get_quality_overlay_footer_text()) > 0
-        except TimeoutException:
-            return False
+        return self.driver.execute_script(
+            'const footer = document.querySelector(arguments[0]);'
+            'return !!footer && footer.textContent.length > 0;',
+            self._quality_overlay_footer.get_full_css_locator()[1])
 
     def quality_popover_is_displayed(self) -> bool:
         """
@@ -726,10 +938,7 @@ class BasicPerspectiveComponent(BasicComponent):
 
         :returns: True, if the quality popover is displayed - False otherwise.
         """
-        try:
-            return self._quality_popover.find() is not None
-        except TimeoutException:
-            return False
+        return self._read_overlay_state()['popover']
 
     def quality_overlay_is_in_micro_mode(self) -> bool:
         """
@@ -737,11 +946,7 @@ class BasicPerspectiveComponent(BasicComponent):
 
         :returns: True, if the quality overlay is in micro mode - False otherwise.
         """
-        try:
-            # fallback to "first"
-            return self._micro_overlay_icons.find().is_displayed()
-        except TimeoutException:
-            return False
+        return self._read_overlay_state()['micro']
 
     def quality_overlay_is_displayed(self) -> bool:
         """
@@ -749,10 +954,7 @@ class BasicPerspectiveComponent(BasicComponent):
 
         :returns: True, if the quality overlay is displayed - False otherwise.
         """
-        try:
-            return self._quality_overlay_state_div.find() is not None
-        except TimeoutException:
-            return False
+        return self._read_overlay_state()['overlay']
 
     def wait_for_no_overlay(
             self, time_to_wait: int = 5, raise_exception: bool = False, wait_on_binding: float = 0) -> None:
@@ -776,32 +978,97 @@ class BasicPerspectiveComponent(BasicComponent):
             if raise_exception:
                 raise toe
 
+    def _read_overlay_state(self) -> dict:
+        """
+        Read the presence of the quality overlay, the displayed state of its micro-mode icons, and the presence of
+        any open quality popover in a single script call, instead of one probe per piece of state.
+
+        :returns: A dictionary with boolean 'overlay', 'micro', and 'popover' keys.
+        """
+        overlay, micro, popover = self.driver.execute_script(
+            'const micro = document.querySelector(arguments[1]);'
+            'return ['
+            '    !!document.querySelector(arguments[0]),'
+            '    !!micro && micro.getClientRects().length > 0,'
+            '    !!document.querySelector(arguments[2])'
+            '];',
+            self._quality_overlay_state_div.get_full_css_locator()[1],
+            self._micro_overlay_icons.get_full_css_locator()[1],
+            self._quality_popover.get_full_css_locator()[1])
+        return {'overlay': overlay, 'micro': micro, 'popover': popover}
+
+    def _get_all_popover_texts(self) -> List[str]:
+        """
+        Click the popover icon of the quality overlay, then obtain the text of every subsection of the Quality
+        Overlay Popover in a single script call instead of one text fetch per subsection.
+
+        :returns: A list which contains the text of every subsection of the Quality Overlay Popover, ordered as the
+            subsections appear in the DOM.
+
+        :raises TimeoutException: If the component has no Quality Overlay, or if the Quality Overlay is in Micro mode.
+        """
+        self.click_quality_overlay_popover_icon()
+        # ensure the popover is present before querying its subsections in-page
+        self._quality_popover.find()
+        return self.driver.execute_script(
+            'return Array.from(document.querySelectorAll(arguments[0])).map(e => e.textContent);',
+            self._quality_popover_subsections.get_full_css_locator()[1])
+
+    @retry_on_stale_element
+    def _get_grid_column_properties(self) -> dict:
+        """
+        Get the grid-column style values of the component in a single script call, for use by the column getters.
+
+        :returns: A dictionary containing the computed 'grid-column' and 'grid-column-end' values of the component.
+
+        :raises TimeoutException: If no element matches the locator of this component.
+        """
+        grid_column, grid_column_end = self.driver.execute_script(
+            'const style = getComputedStyle(arguments[0]); return [style.gridColumn, style.gridColumnEnd];',
+            self.find())
+        return {'grid-column': grid_column, 'grid-column-end': grid_column_end}
+
 
 class _LocatorBuilder:
+    """
+    Builds full selectors from locator chains. Locator chains are immutable tuples, so built selectors are shared
+    across every component which resolves the same chain - including sibling instances.
+    """
+    # Pre-bound selector templates keyed by By type, replacing per-locator elif chains in the builders below.
+    _CSS_BUILDERS = {
+        By.ID: '[id="{0}"]'.format,
+        By.CLASS_NAME: '.{0}'.format,
+        By.NAME: '[name="{0}"]'.format
+    }
+    _XPATH_BUILDERS = {
+        By.ID: '//*[@id="{0}"]'.format,
+        By.CLASS_NAME: '//*[contains(concat(" ", normalize-space(@class), " "),"{0}")]'.format,
+        By.NAME: '//*[@name="{0}"]'.format,
+        By.LINK_TEXT: '//a[normalize-space()="{0}"]'.format,
+        By.PARTIAL_LINK_TEXT: '//a[contains(normalize-space(),"{0}")]'.format,
+        By.TAG_NAME: '//{0}'.format
+    }
+
     @staticmethod
-    def get_css_locator(locators: list) -> Tuple[Union[By, str], str]:
+    @lru_cache(maxsize=1024)
+    def get_css_locator(locators: tuple) -> Tuple[Union[By, str], str]:
         css_list = []
         for locator in locators:
             by = By.CSS_SELECTOR
             value = locator
-            if type(locator) == tuple:
+            if isinstance(locator, tuple):
                 by = locator[0]
                 value = locator[1]
             if by == By.XPATH:
                 raise TypeError(
                     f'Locator: {locator} has a By type of XPATH which is incompatible with the css_selector builder.')
-            elif by == By.ID:
-                css_list.append(f'[id="{value}"]')
-            elif by == By.CLASS_NAME:
-                css_list.append(f'.{value}')
-            elif by == By.NAME:
-                css_list.append(f'[name="{value}"]')
-            else:
-                css_list.append(value)
+            builder = _LocatorBuilder._CSS_BUILDERS.get(by)
+            css_list.append(builder(value) if builder else value)
         return By.CSS_SELECTOR, " ".join(css_list)
 
     @staticmethod
-    def get_xpath_locator(locators: list) -> Tuple[Union[By, str], str]:
+    @lru_cache(maxsize=1024)
+    def get_xpath_locator(locators: tuple) -> Tuple[Union[By, str], str]:
         xpath_list = []
         for locator in locators:
             by = locator[0]
@@ -809,18 +1076,6 @@ class _LocatorBuilder:
             if by == By.CSS_SELECTOR:
                 raise TypeError(
                     f'Locator: {locator} has a By type of CSS_SELECTOR which is incompatible with the xpath builder.')
-            elif by == By.ID:
-                xpath_list.append(f'//*[@id="{value}"]')
-            elif by == By.CLASS_NAME:
-                xpath_list.append(f'//*[contains(concat(" ", normalize-space(@class), " "),"{value}")]')
-            elif by == By.NAME:
-                xpath_list.append(f'//*[@name="{value}"]')
-            elif by == By.LINK_TEXT:
-                xpath_list.append(f'//a[normalize-space()="{value}"]')
-            elif by == By.PARTIAL_LINK_TEXT:
-                xpath_list.append(f'//a[contains(normalize-space(),"{value}")]')
-            elif by == By.TAG_NAME:
-                xpath_list.append(f'//{value}')
-            else:
-                xpath_list.append(value)
+            builder = _LocatorBuilder._XPATH_BUILDERS.get(by)
+            xpath_list.append(builder(value) if builder else value)
         return By.XPATH, "".join(xpath_list)
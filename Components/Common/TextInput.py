@@ -1,6 +1,8 @@
+import sys
+from functools import lru_cache
 from typing import Optional, Union, Tuple, List
 
-from selenium.common.exceptions import ElementClickInterceptedException
+from selenium.common.exceptions import ElementClickInterceptedException, WebDriverException
 from selenium.webdriver import ActionChains
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
@@ -11,6 +13,15 @@ from Helpers.IAAssert import IAAssert
 from Helpers.IAExpectedConditions.IAExpectedConditions import TextCondition
 
 
+@lru_cache(maxsize=256)
+def _sanitize_text(text: str) -> str:
+    """
+    Strip special characters (ESC, ENTER) while leaving spaces and punctuation. Cached because data-driven tests
+    tend to repeat the same payloads many times.
+    """
+    return text.encode("ascii", "ignore").decode()
+
+
 class CommonTextInput(ComponentPiece):
     """A common-use input field."""
     _INTERNAL_INPUT_LOCATOR = (By.TAG_NAME, "input")
@@ -30,6 +41,7 @@ class CommonTextInput(ComponentPiece):
             wait_timeout=wait_timeout,
             description=description,
             poll_freq=poll_freq)
+        self._needs_internal_input = None
         # The internal input piece is important for when our component has a quality overlay because any reference
         # made using something like an id would now refer to the <div> level instead.
         self._internal_input = ComponentPiece(
@@ -47,16 +59,16 @@ class CommonTextInput(ComponentPiece):
 
         :returns: The text a user sees within this component when no value has been supplied.
         """
-        return self.find().get_attribute("placeholder")
+        return self.find().get_dom_attribute("placeholder")
 
     def get_text(self) -> str:
         """
         Obtain the text contained within this component.
 
-        :returns: The text contents of the component via the `value` attribute.
+        :returns: The text contents of the component via the `value` property.
         """
         input_component = self._internal_input if self._needs_to_get_input_element() else self
-        return input_component.find().get_attribute("value")
+        return input_component.find().get_property("value")
 
     def placeholder_text_exists(self) -> bool:
         """
@@ -64,7 +76,9 @@ class CommonTextInput(ComponentPiece):
 
         :returns: True, if a component is currently displaying placeholder text - False otherwise.
         """
-        return (self.find().get_attribute("placeholder") is not None) and (self.find().get_attribute("value") is None)
+        placeholder, value = self.driver.execute_script(
+            'return [arguments[0].placeholder, arguments[0].value];', self.find())
+        return bool(placeholder) and not value
 
     def set_text(
             self,
@@ -81,41 +95,103 @@ class CommonTextInput(ComponentPiece):
             code to continue.
         """
         text = str(text)
-        # strip special characters (ESC, ENTER) while leaving spaces and punctuation
-        expected_text = text.encode("ascii", "ignore").decode()
-        if text is None or text == '':
-            text = ' ' + Keys.BACKSPACE
-        self.wait_on_text_condition(text_to_compare="", condition=TextCondition.DOES_NOT_EQUAL, wait_timeout=0.5)
-        current_text = self.get_text()  # Do NOT wait on matching text to be in place
-        keys_to_send = ''.join([Keys.ARROW_RIGHT for _ in current_text] +
-                               [Keys.BACKSPACE for _ in current_text] +
-                               [text])
-        self.scroll_to_element()
+        expected_text = _sanitize_text(text)
         input_object = self
         if self._needs_to_get_input_element():
             input_object = self._internal_input
+        if text == '':
+            # React dedupes direct `.value` assignment against its value tracker, so a scripted clear leaves the
+            # session-side value untouched even though the DOM reads empty. Clear with real keystrokes (select-all,
+            # then delete) and verify the result just like any other write.
+            input_object.click()
+            element = input_object.find()
+            select_all_key = Keys.COMMAND if sys.platform.startswith('darwin') else Keys.CONTROL
+            element.send_keys(select_all_key + 'a')
+            element.send_keys(Keys.DELETE)
+            if release_focus:
+                self.release_focus()
+            IAAssert.is_equal_to(
+                actual_value=self._wait_for_value_in_page(
+                    expected_value='', wait_timeout=binding_wait_time + 0.5),
+                expected_value='',
+                failure_msg="Failed to clear the value of the input.")
+            self.wait_on_binding(time_to_wait=binding_wait_time)
+            return
+        self.wait_on_text_condition(text_to_compare="", condition=TextCondition.DOES_NOT_EQUAL, wait_timeout=0.5)
+        in_viewport = self.driver.execute_script(
+            'const r = arguments[0].getBoundingClientRect();'
+            'return r.top >= 0 && r.bottom <= window.innerHeight && r.left >= 0 && r.right <= window.innerWidth;',
+            input_object.find())
+        if not in_viewport:
+            self.scroll_to_element()
         try:
             input_object.click()
         except ElementClickInterceptedException:
-            # quality overlay interference
-            ActionChains(driver=self.driver) \
-                .move_to_element_with_offset(to_element=input_object.find(), xoffset=5, yoffset=5) \
-                .click() \
-                .perform()
-        input_object.find().send_keys(keys_to_send)
+            # quality overlay interference - a script click bypasses the overlay without building a pointer-action
+            # payload, so only fall back to the offset ActionChains click if even that fails.
+            try:
+                self.driver.execute_script('arguments[0].click();', input_object.find())
+            except WebDriverException:
+                ActionChains(driver=self.driver) \
+                    .move_to_element_with_offset(to_element=input_object.find(), xoffset=5, yoffset=5) \
+                    .click() \
+                    .perform()
+        # The click can dismiss a quality overlay and re-render the field, so only resolve the element to act on
+        # once the click has succeeded; the same handle then serves the clear and the keystrokes.
+        element = input_object.find()
+        # Clear any existing value in one script call instead of sending one ARROW_RIGHT and one BACKSPACE per
+        # existing character.
+        try:
+            self.driver.execute_script(
+                "arguments[0].value = '';"
+                "arguments[0].dispatchEvent(new Event('input', {bubbles: true}));",
+                element)
+        except WebDriverException:
+            element.clear()
+        element.send_keys(text)
         if release_focus:
             self.release_focus()
         IAAssert.is_equal_to(
-            actual_value=self.wait_on_text_condition(
-                text_to_compare=expected_text, condition=TextCondition.EQUALS, wait_timeout=binding_wait_time + 0.5),
+            actual_value=self._wait_for_value_in_page(
+                expected_value=expected_text, wait_timeout=binding_wait_time + 0.5),
             expected_value=expected_text,
             failure_msg="Failed to set the value of the input.")
         self.wait_on_binding(time_to_wait=binding_wait_time)
 
+    def _wait_for_value_in_page(self, expected_value: str, wait_timeout: float) -> str:
+        """
+        Wait for this input to hold the supplied value by polling inside the browser, instead of issuing one HTTP
+        command per client-side poll iteration.
+
+        :param expected_value: The value we expect the input to eventually hold.
+        :param wait_timeout: The amount of time (in seconds) to poll before giving up and returning the current value.
+
+        :returns: The value of the input once it matches the expected value, or whatever value the input held when
+            the supplied timeout elapsed.
+        """
+        input_object = self._internal_input if self._needs_to_get_input_element() else self
+        return self.driver.execute_async_script(
+            'const element = arguments[0];'
+            'const expected = arguments[1];'
+            'const timeout = arguments[2];'
+            'const done = arguments[3];'
+            'if (element.value === expected) { done(element.value); return; }'
+            'const start = Date.now();'
+            'const interval = setInterval(function() {'
+            '    if (element.value === expected || Date.now() - start >= timeout) {'
+            '        clearInterval(interval);'
+            '        done(element.value);'
+            '    }'
+            '}, 50);',
+            input_object.find(), expected_value, wait_timeout * 1000)
+
     def _needs_to_get_input_element(self) -> bool:
         """
         Determine if the Component IS the <input>, or if we should instead query for the internal <input>.
 
         :returns: True, if the current component definition would fail to operate as an <input> - False otherwise.
         """
-        return self.find().tag_name not in ['input', 'textarea']
+        if self._needs_internal_input is None:
+            # The tag of the outer component never changes for a given instance, so determine this only once.
+            self._needs_internal_input = self.find().tag_name not in ('input', 'textarea')
+        return self._needs_internal_input
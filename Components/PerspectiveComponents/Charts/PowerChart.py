@@ -17,6 +17,7 @@ from Components.PerspectiveComponents.Common.DateRangeSelector import \
 from Components.PerspectiveComponents.Common.Table import Table as CommonTable
 from Components.PerspectiveComponents.Common.TagBrowseTree import CommonTagBrowseTree
 from Components.PerspectiveComponents.Inputs.TextField import TextField
+from Helpers.AdaptiveWait import AdaptiveWait
 from Helpers.CSSEnumerations import CSS, CSSPropertyValue
 from Helpers.IAAssert import IAAssert
 from Helpers.IAExpectedConditions import IAExpectedConditions as IAec
@@ -1560,12 +1561,8 @@ class PowerChart(BasicPerspectiveComponent):
                 description="The 'Delete' button visible after having clicked the trash can icon for a row in the "
                             "pen control table.",
                 poll_freq=poll_freq)
-            self._pen_checkbox = ComponentPiece(
-                locator=(By.CSS_SELECTOR, f''),  # placeholder, to be overwritten with local pen name
-                driver=self.driver,
-                parent_locator_list=self._pen_table_body.locator_list,
-                description="The checkbox which drives whether a given pen is displayed in the graph.",
-                poll_freq=poll_freq)
+            self._pen_checkbox_dict = {}
+            self._pen_checkbox_path_dict = {}
             self._pen_control_columns = {}
             self._range_brush_columns = {}
             self._pen_table_expand_collapse_svg = ComponentPiece(
@@ -1596,10 +1593,7 @@ class PowerChart(BasicPerspectiveComponent):
 
             :raises TimeoutException: If no pen with the supplied name is present.
             """
-            self._pen_checkbox.set_locator(
-                new_locator=(
-                    By.CSS_SELECTOR, self._UNFORMATTED_PEN_VISIBILITY_CHECKBOX_SELECTOR_STRING.format(pen_name)))
-            self._pen_checkbox.click()
+            self._get_pen_checkbox(pen_name=pen_name).click()
 
         def click_pencil_icon_for_pen(self, pen_name: str) -> None:
             """
@@ -1678,11 +1672,7 @@ class PowerChart(BasicPerspectiveComponent):
             :raises TimeoutException: If no pen with the supplied name is present in the pen control table, or if the
                 pen control table is not present.
             """
-            self._pen_checkbox.set_locator(
-                new_locator=(
-                    By.CSS_SELECTOR,
-                    f'{self._UNFORMATTED_PEN_VISIBILITY_CHECKBOX_SELECTOR_STRING.format(pen_name)} > path'))
-            return self._pen_checkbox.get_css_property(property_name=CSS.FILL)
+            return self._get_pen_checkbox_path(pen_name=pen_name).get_css_property(property_name=CSS.FILL)
 
         def pen_checkbox_is_active(self, pen_name: str) -> bool:
             """
@@ -1695,11 +1685,8 @@ class PowerChart(BasicPerspectiveComponent):
             :raises TimeoutException: If no pen with the supplied name is present in the pen control table, or if the
                 pen control table is not present.
             """
-            self._pen_checkbox.set_locator(
-                new_locator=(
-                    By.CSS_SELECTOR,
-                    f'{self._UNFORMATTED_PEN_VISIBILITY_CHECKBOX_SELECTOR_STRING.format(pen_name)} > path'))
-            return self._pen_checkbox.find().get_attribute('d') == self._PEN_CHECKBOX_SVG_CHECKED
+            return self._get_pen_checkbox_path(
+                pen_name=pen_name).find().get_attribute('d') == self._PEN_CHECKBOX_SVG_CHECKED
 
         def get_row_data_by_row_index(self, zero_based_row_index: int) -> dict:
             """
@@ -1734,6 +1721,46 @@ class PowerChart(BasicPerspectiveComponent):
                 self._pen_control_table_cells_dict[zero_based_row_index] = cells
             return cells
 
+        def _get_pen_checkbox(self, pen_name: str) -> ComponentPiece:
+            """
+            Obtain a ComponentPiece which describes how to locate the visibility checkbox of a pen. Components are
+            cached by pen name, so repeated calls for the same pen do not rebuild the locator.
+
+            :param pen_name: The name of the pen the checkbox belongs to.
+            """
+            checkbox = self._pen_checkbox_dict.get(pen_name)
+            if not checkbox:
+                checkbox = ComponentPiece(
+                    locator=(
+                        By.CSS_SELECTOR, self._UNFORMATTED_PEN_VISIBILITY_CHECKBOX_SELECTOR_STRING.format(pen_name)),
+                    driver=self.driver,
+                    parent_locator_list=self._pen_table_body.locator_list,
+                    description="The checkbox which drives whether a given pen is displayed in the graph.",
+                    poll_freq=self.poll_freq)
+                self._pen_checkbox_dict[pen_name] = checkbox
+            return checkbox
+
+        def _get_pen_checkbox_path(self, pen_name: str) -> ComponentPiece:
+            """
+            Obtain a ComponentPiece which describes how to locate the svg path of the visibility checkbox of a pen.
+            Components are cached by pen name, so repeated calls for the same pen do not rebuild the locator.
+
+            :param pen_name: The name of the pen the checkbox belongs to.
+            """
+            path = self._pen_checkbox_path_dict.get(pen_name)
+            if not path:
+                path = ComponentPiece(
+                    locator=(
+                        By.CSS_SELECTOR,
+                        f'{self._UNFORMATTED_PEN_VISIBILITY_CHECKBOX_SELECTOR_STRING.format(pen_name)} > path'),
+                    driver=self.driver,
+                    parent_locator_list=self._pen_table_body.locator_list,
+                    description="The svg path of the checkbox which drives whether a given pen is displayed in "
+                                "the graph.",
+                    poll_freq=self.poll_freq)
+                self._pen_checkbox_path_dict[pen_name] = path
+            return path
+
         def pen_control_column_is_displayed(
                 self, pen_control_column: Union[PenControlColumn, RangeBrushColumn]) -> bool:
             """
@@ -1973,8 +2000,8 @@ class PowerChart(BasicPerspectiveComponent):
                             and (path_nodes.index(i) != len(path_nodes)-1):
                         folder_index = self._get_index_of_item_in_tree(item_label=i)
                         self._folder_icons.find_all()[folder_index].click()
-                        self.wait_on_binding(time_to_wait=1)
-                        WebDriverWait(driver=self.driver, timeout=3, poll_frequency=self.poll_freq).until(
+                        # No fixed post-click sleep; the backoff wait below returns as soon as the node expands.
+                        AdaptiveWait(driver=self.driver, timeout=4, poll_frequency=self.poll_freq).until(
                             IAec.function_returns_true(
                                 custom_function=self.item_is_expanded,
                                 function_args={'item_label': i}))
@@ -1,4 +1,5 @@
 import sys
+from functools import cached_property, lru_cache
 from typing import List, Optional, Tuple
 
 from selenium.common.exceptions import TimeoutException
@@ -11,6 +12,21 @@ from Components.BasicComponent import ComponentPiece
 from Components.PerspectiveComponents.Common.Icon import CommonIcon
 
 
+class _ItemPieces:
+    """
+    The lazily populated ComponentPieces associated with a single item label: the item itself, its label, its
+    expansion icon, and its node icon. Bundling these under one cache entry means call-sites hash the label once
+    instead of probing up to four separate dicts.
+    """
+    __slots__ = ('item', 'label', 'expand_icon', 'node_icon')
+
+    def __init__(self):
+        self.item = None
+        self.label = None
+        self.expand_icon = None
+        self.node_icon = None
+
+
 class CommonTree(ComponentPiece):
     """
     A Tree of items, as is found as part of the Tree Component, the Tag Browse Tree, and the Power Chart.
@@ -45,30 +61,39 @@ class CommonTree(ComponentPiece):
             wait_timeout=wait_timeout,
             description=description,
             poll_freq=poll_freq)
-        self._folder_icons = ComponentPiece(
+        self._item_pieces = {}
+
+    @cached_property
+    def _folder_icons(self) -> ComponentPiece:
+        return ComponentPiece(
             locator=self._FOLDER_EXPAND_ICON_LOCATOR,
             driver=self.driver,
             parent_locator_list=self.locator_list,
-            poll_freq=poll_freq)
-        self._expanded_folders = ComponentPiece(
+            poll_freq=self.poll_freq)
+
+    @cached_property
+    def _expanded_folders(self) -> ComponentPiece:
+        return ComponentPiece(
             locator=(By.CSS_SELECTOR, f'div[class*="expanded"] div.text-scroll'),
             driver=self.driver,
             parent_locator_list=self.locator_list,
-            poll_freq=poll_freq)
-        self._top_level_items = ComponentPiece(
+            poll_freq=self.poll_freq)
+
+    @cached_property
+    def _top_level_items(self) -> ComponentPiece:
+        return ComponentPiece(
             locator=self._TOP_LEVEL_ITEMS_LOCATOR,
-            driver=driver,
+            driver=self.driver,
             parent_locator_list=self.locator_list,
-            poll_freq=poll_freq)
-        self._tree_items = ComponentPiece(
+            poll_freq=self.poll_freq)
+
+    @cached_property
+    def _tree_items(self) -> ComponentPiece:
+        return ComponentPiece(
             locator=self._TREE_ITEM_LOCATOR,
             driver=self.driver,
             parent_locator_list=self.locator_list,
-            poll_freq=poll_freq)
-        self._items = {}
-        self._item_icons = {}
-        self._expand_collapse_icons = {}
-        self._labels = {}
+            poll_freq=self.poll_freq)
 
     def click_expansion_icon_for_item(self, item_label: str, binding_wait_time: int = 0) -> None:
         """
@@ -94,15 +119,14 @@ class CommonTree(ComponentPiece):
         :raises TimeoutException: If no item with the supplied text is available to be clicked. This could either mean
             no item with that text exists, or the target item could be inside an item which has not yet been expanded.
         """
-        label = self._labels.get(item_label)
-        if not label:
-            label = ComponentPiece(
+        pieces = self._get_item_pieces(item_label=item_label)
+        if not pieces.label:
+            pieces.label = ComponentPiece(
                 locator=self._LABEL_LOCATOR,
                 driver=self.driver,
                 parent_locator_list=self._get_item_by_label(item_label=item_label).locator_list,
                 poll_freq=self.poll_freq)
-            self._labels[item_label] = label
-        label.click(binding_wait_time=binding_wait_time)
+        pieces.label.click(binding_wait_time=binding_wait_time)
 
     def expansion_icon_is_present_for_item(self, item_label: str) -> bool:
         """
@@ -111,15 +135,8 @@ class CommonTree(ComponentPiece):
         :returns: True, if an expansion icon is displayed for the first item with the supplied text. False, if an
             expansion icon is not displayed, or if no item with the supplied text exists.
         """
-        try:
-            return ComponentPiece(
-                locator=(By.CSS_SELECTOR, "g"),
-                driver=self.driver,
-                parent_locator_list=self._get_expansion_icon(item_label=item_label).locator_list,
-                wait_timeout=1,
-                poll_freq=self.poll_freq).find().is_displayed()
-        except TimeoutException:
-            return False
+        return self._probe_is_displayed(
+            css_selector=f'{self._get_expansion_icon(item_label=item_label).get_full_css_locator()[1]} g')
 
     def get_fill_color_of_expansion_icon_for_item(self, item_label: str) -> str:
         """
@@ -168,23 +185,48 @@ class CommonTree(ComponentPiece):
         Obtain the text of all items located at the top-most level.
         """
         try:
-            return [_.text for _ in self._top_level_items.find_all()]
+            self._top_level_items.find()
         except TimeoutException:
             return []
+        return self.driver.execute_script(
+            'return Array.from(document.querySelectorAll(arguments[0])).map(e => e.innerText);',
+            self._top_level_items.get_full_css_locator()[1])
 
-    def get_text_of_all_items_in_tree(self, wait_timeout: float = 5) -> List[str]:
+    def get_text_of_all_items_in_tree(self, wait_timeout: float = 5, limit: Optional[int] = None) -> List[str]:
         """
         Obtain a list which contains the text of all displayed items in the Tree.
 
         :param wait_timeout: How long to wait (in seconds) for any tree items to appear.
+        :param limit: An optional cap on how many item texts to collect, for callers which only need the first few.
         """
         try:
-            return [item.text for item in self._tree_items.find_all(wait_timeout=wait_timeout)]
+            self._tree_items.find(wait_timeout=wait_timeout)
         except TimeoutException:
             return []
+        return self.driver.execute_script(
+            'const items = Array.from(document.querySelectorAll(arguments[0]));'
+            'return (arguments[1] === null ? items : items.slice(0, arguments[1])).map(e => e.innerText);',
+            self._tree_items.get_full_css_locator()[1],
+            limit)
+
+    def contains_item_with_label(self, item_label: str) -> bool:
+        """
+        Determine if any currently rendered item has the supplied label, without waiting or enumerating the tree.
+
+        :param item_label: The label text of the item whose existence you wish to verify.
+
+        :returns: True, if any rendered item matches the supplied text - False otherwise.
+        """
+        return self.driver.execute_script(
+            'return !!document.querySelector(arguments[0]);',
+            self._get_item_by_label(item_label=item_label).get_full_css_locator()[1])
 
     def multi_select_items(
-            self, item_labels: List[str], inclusive_multi_selection: bool = True, wait_timeout: float = 5) -> None:
+            self,
+            item_labels: List[str],
+            inclusive_multi_selection: bool = True,
+            wait_timeout: float = 5,
+            per_click_pause: float = 0) -> None:
         """
         Select multiple items within the Tree. Note that any selections previous to this function could be lost.
 
@@ -192,6 +234,8 @@ class CommonTree(ComponentPiece):
         :param inclusive_multi_selection: Dictates whether we are holding Shift (True) or CMD/Ctrl (False) while making
             the selections.
         :param wait_timeout: The amount of time to wait for each item to become available before attempting selection.
+        :param per_click_pause: The amount of time (in seconds) to pause after clicking each item, for Trees whose
+            selection handling needs time between clicks.
 
         :raises TimeoutException: If no item exists with text matching any individual entry from the items_list.
         """
@@ -203,11 +247,15 @@ class CommonTree(ComponentPiece):
 
         actions.key_down(mod_key)
         piece_list = [self._get_item_by_label(item_label=_, wait_timeout=wait_timeout) for _ in item_labels]
+        # Resolve every item in one script call; any item missing from the batch falls back to its own find().
+        ComponentPiece.prefetch(components=piece_list)
         for piece in piece_list:
-            actions.click(on_element=piece.find()).pause(1)
+            actions.click(on_element=piece.find())
+            if per_click_pause:
+                actions.pause(per_click_pause)
+        actions.pause(0.2)
         actions.key_up(mod_key)
         actions.perform()
-        self.wait_on_binding(1)
 
     def item_label_exists_in_tree(self, item_label: str, wait_timeout: int = 5) -> bool:
         """
@@ -229,14 +277,15 @@ class CommonTree(ComponentPiece):
 
         :param item_label: The label text of the item we will check the expanded status of.
 
-        :raises TimeoutException: If the item we check does not have an expansion icon. This likely means that the
-            specified item is a terminal node and may not be expanded.
+        :returns: True, if the item is expanded - False otherwise. Items without an expansion icon (terminal nodes,
+            which may not be expanded) report False rather than raising; callers which must distinguish a collapsed
+            item from a non-expandable one should check :func:`expansion_icon_is_present_for_item` separately.
         """
-        try:
-            return self._EXPANDED_ICON_CLASS in self._get_expansion_icon(
-                item_label=item_label).find().get_attribute(name="class")
-        except TimeoutException:
-            return False
+        return self.driver.execute_script(
+            'const icon = document.querySelector(arguments[0]);'
+            'return !!icon && icon.classList.contains(arguments[1]);',
+            self._get_expansion_icon(item_label=item_label).get_full_css_locator()[1],
+            self._EXPANDED_ICON_CLASS)
 
     def node_icon_is_present_for_item(self, item_label: str) -> bool:
         """
@@ -248,15 +297,8 @@ class CommonTree(ComponentPiece):
         :returns: True, if an icon which would convey the type of the item is displayed for the first item with the
             supplied text. False, if an icon is not displayed, or if no item with the supplied text exists.
         """
-        try:
-            return ComponentPiece(
-                locator=(By.CSS_SELECTOR, "g"),
-                driver=self.driver,
-                parent_locator_list=self._get_item_icon(item_label=item_label).locator_list,
-                wait_timeout=1,
-                poll_freq=self.poll_freq).find().is_displayed()
-        except TimeoutException:
-            return False
+        return self._probe_is_displayed(
+            css_selector=f'{self._get_item_icon(item_label=item_label).get_full_css_locator()[1]} g')
 
     def select_item_in_tree(self, item_label: str, wait_timeout: int = 5, binding_wait_time: int = 1) -> None:
         """
@@ -292,46 +334,77 @@ class CommonTree(ComponentPiece):
 
     def _get_expansion_icon(self, item_label: str) -> CommonIcon:
         """Obtain the icon which conveys the expansion status of the item."""
-        icon = self._expand_collapse_icons.get(item_label)
-        if not icon:
-            icon = CommonIcon(
+        pieces = self._get_item_pieces(item_label=item_label)
+        if not pieces.expand_icon:
+            pieces.expand_icon = CommonIcon(
                 locator=(By.CSS_SELECTOR, "svg.expand-icon"),
                 driver=self.driver,
                 parent_locator_list=self._get_item_by_label(item_label=item_label).locator_list,
                 poll_freq=self.poll_freq)
-            self._expand_collapse_icons[item_label] = icon
-        return icon
+        return pieces.expand_icon
 
     def _get_item_icon(self, item_label: str) -> CommonIcon:
         """Obtain the icon which conveys whether the item is a directory/folder or a terminal node."""
-        icon = self._item_icons.get(item_label)
-        if not icon:
-            icon = CommonIcon(
+        pieces = self._get_item_pieces(item_label=item_label)
+        if not pieces.node_icon:
+            pieces.node_icon = CommonIcon(
                 locator=(By.CSS_SELECTOR, "svg.node-icon"),
                 driver=self.driver,
                 parent_locator_list=self._get_item_by_label(item_label=item_label).locator_list,
                 poll_freq=self.poll_freq)
-            self._item_icons[item_label] = icon
-        return icon
+        return pieces.node_icon
+
+    def _probe_is_displayed(self, css_selector: str) -> bool:
+        """
+        Determine in a single script call whether the first element matching a selector exists and is displayed,
+        instead of locating the element and then asking about its displayed state as two separate commands.
+        """
+        return self.driver.execute_script(
+            'const e = document.querySelector(arguments[0]);'
+            'return !!e && e.getClientRects().length > 0;',
+            css_selector)
+
+    def _get_item_pieces(self, item_label: str) -> _ItemPieces:
+        """Obtain the bundle of cached ComponentPieces for an item label, creating an empty bundle if needed."""
+        pieces = self._item_pieces.get(item_label)
+        if not pieces:
+            pieces = _ItemPieces()
+            self._item_pieces[sys.intern(item_label)] = pieces
+        return pieces
 
     def _get_index_of_item_in_tree(self, item_label: str) -> int:
         """Get the zero-indexed position among all items for the label with the supplied text."""
-        return [_.text for _ in self._tree_items.find_all()].index(item_label)
+        return self.driver.execute_script(
+            'return Array.from(document.querySelectorAll(arguments[0])).map(e => e.innerText);',
+            self._tree_items.get_full_css_locator()[1]).index(item_label)
 
     def _get_item_by_label(self, item_label: str, wait_timeout: float = 5) -> ComponentPiece:
         """Obtain the first item with the supplied text."""
-        item = self._items.get(item_label)
-        if not item:
-            item = ComponentPiece(
-                locator=(By.CSS_SELECTOR, f'{self._TREE_ITEM_LOCATOR[1]}[data-label="{item_label}"]'),
+        pieces = self._get_item_pieces(item_label=item_label)
+        if not pieces.item:
+            pieces.item = ComponentPiece(
+                locator=(By.CSS_SELECTOR, self._item_selector_for_label(item_label)),
                 driver=self.driver,
                 parent_locator_list=self.locator_list,
                 wait_timeout=wait_timeout,
                 poll_freq=self.poll_freq)
-            self._items[item_label] = item
-        return item
+        return pieces.item
+
+    def _item_selector_for_label(self, item_label: str) -> str:
+        """Build the CSS fragment which targets an item by label within this type of Tree."""
+        return self._build_item_selector(tree_item_css=self._TREE_ITEM_LOCATOR[1], item_label=item_label)
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _build_item_selector(tree_item_css: str, item_label: str) -> str:
+        """
+        Build the CSS fragment which targets an item by label; cached because labels recur across trees, and keyed
+        on the item locator fragment so subclasses which override _TREE_ITEM_LOCATOR never share entries.
+        """
+        return f'{tree_item_css}[data-label="{item_label}"]'
 
-    @classmethod
-    def _split_item_label_path(cls, slash_delimited_label_path: str) -> List[str]:
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _split_item_label_path(slash_delimited_label_path: str) -> Tuple[str, ...]:
         """Obtain the pieces of a string after having split the string on a slas ('/')."""
-        return slash_delimited_label_path.split('/')
+        return tuple(slash_delimited_label_path.split('/'))
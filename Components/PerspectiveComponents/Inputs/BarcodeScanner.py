@@ -34,10 +34,9 @@ class BarcodeScanner(BasicPerspectiveComponent):
 
         :returns: True, if any text content is displayed by the component - False otherwise.
         """
-        try:
-            return self._label.find().is_displayed() and (len(self._label.get_text()) > 0)
-        except TimeoutException:
-            return False
+        return self._label.exists_now() \
+            and self._label.is_displayed() \
+            and (len(self._label.get_text()) > 0)
 
     def get_text(self, **kwargs) -> Optional[str]:
         """
@@ -18,16 +18,8 @@ class Button(CommonButton, BasicPerspectiveComponent):
             wait_timeout: float = 3,
             description: Optional[str] = None,
             poll_freq: float = 0.5):
-        CommonButton.__init__(
-            self,
-            locator=locator,
-            driver=driver,
-            parent_locator_list=parent_locator_list,
-            wait_timeout=wait_timeout,
-            description=description,
-            poll_freq=poll_freq)
-        BasicPerspectiveComponent.__init__(
-            self,
+        # Both bases forward through super(), so one cooperative call runs each __init__ in the MRO exactly once.
+        super().__init__(
             locator=locator,
             driver=driver,
             parent_locator_list=parent_locator_list,
@@ -18,15 +18,9 @@ class Checkbox(CommonCheckbox, BasicPerspectiveComponent):
             wait_timeout: float = 3,
             description: Optional[str] = None,
             poll_freq: float = 0.5):
-        CommonCheckbox.__init__(
-            self, locator=locator,
-            driver=driver,
-            parent_locator_list=parent_locator_list,
-            wait_timeout=wait_timeout,
-            description=description,
-            poll_freq=poll_freq)
-        BasicPerspectiveComponent.__init__(
-            self, locator=locator,
+        # Both bases forward through super(), so one cooperative call runs each __init__ in the MRO exactly once.
+        super().__init__(
+            locator=locator,
             driver=driver,
             parent_locator_list=parent_locator_list,
             wait_timeout=wait_timeout,
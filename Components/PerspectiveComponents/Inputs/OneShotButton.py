@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import List, Optional, Tuple
 
 from selenium.common.exceptions import TimeoutException
@@ -8,6 +9,7 @@ from Components.BasicComponent import ComponentPiece
 from Components.PerspectiveComponents.Common.ComponentModal import ComponentModal
 from Components.PerspectiveComponents.Common.Icon import CommonIcon
 from Components.PerspectiveComponents.Inputs.Button import Button
+from Helpers.AdaptiveWait import AdaptiveWait
 
 
 class OneShotButton(Button):
@@ -32,27 +34,42 @@ class OneShotButton(Button):
             wait_timeout=wait_timeout,
             description=description,
             poll_freq=poll_freq)
-        self._modal = ComponentModal(driver=driver, poll_freq=poll_freq)
-        self._cancel_button = Button(
+
+    @cached_property
+    def _modal(self) -> ComponentModal:
+        return ComponentModal(driver=self.driver, poll_freq=self.poll_freq)
+
+    @cached_property
+    def _cancel_button(self) -> Button:
+        return Button(
             locator=self._CANCEL_BUTTON_LOCATOR,
-            driver=driver,
+            driver=self.driver,
             parent_locator_list=self._modal.locator_list,
-            poll_freq=poll_freq)
-        self._confirm_button = Button(
+            poll_freq=self.poll_freq)
+
+    @cached_property
+    def _confirm_button(self) -> Button:
+        return Button(
             locator=self._CONFIRM_BUTTON_LOCATOR,
-            driver=driver,
+            driver=self.driver,
             parent_locator_list=self._modal.locator_list,
-            poll_freq=poll_freq)
-        self._modal_message = ComponentPiece(
+            poll_freq=self.poll_freq)
+
+    @cached_property
+    def _modal_message(self) -> ComponentPiece:
+        return ComponentPiece(
             locator=self._MODAL_MESSAGE_LOCATOR,
-            driver=driver,
+            driver=self.driver,
             parent_locator_list=self._modal.locator_list,
-            poll_freq=poll_freq)
-        self._local_icon = CommonIcon(
+            poll_freq=self.poll_freq)
+
+    @cached_property
+    def _local_icon(self) -> CommonIcon:
+        return CommonIcon(
             locator=self._ICON_LOCATOR,
-            driver=driver,
+            driver=self.driver,
             parent_locator_list=self.locator_list,
-            poll_freq=poll_freq)
+            poll_freq=self.poll_freq)
 
     def click_cancel_in_modal(self) -> None:
         """
@@ -76,7 +93,11 @@ class OneShotButton(Button):
 
         :returns: True, if the confirmation modal is present - False otherwise.
         """
+        modal_locator = self._modal.get_full_css_locator()
+        confirm_locator = self._confirm_button.get_full_css_locator()
         try:
-            return self._modal.find(wait_timeout=0.5) is not None and self._confirm_button.find(0.5) is not None
+            return bool(
+                AdaptiveWait(driver=self.driver, timeout=0.5, poll_frequency=self.poll_freq).until(
+                    lambda driver: driver.find_elements(*modal_locator) and driver.find_elements(*confirm_locator)))
         except TimeoutException:
             return False
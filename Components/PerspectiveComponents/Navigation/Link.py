@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import Optional, Tuple, List
 
 from selenium.webdriver.common.by import By
@@ -8,6 +9,7 @@ from Components.BasicComponent import BasicPerspectiveComponent, ComponentPiece
 
 class Link(BasicPerspectiveComponent):
     """A Perspective Link Component."""
+    _ANCHOR_LOCATOR = (By.TAG_NAME, "a")
 
     def __init__(
             self,
@@ -24,11 +26,15 @@ class Link(BasicPerspectiveComponent):
             wait_timeout=wait_timeout,
             description=description,
             poll_freq=poll_freq)
-        self._anchor = ComponentPiece(
-            locator=(By.TAG_NAME, "a"),
-            driver=driver,
+        self._state = None
+
+    @cached_property
+    def _anchor(self) -> ComponentPiece:
+        return ComponentPiece(
+            locator=self._ANCHOR_LOCATOR,
+            driver=self.driver,
             parent_locator_list=self.locator_list,
-            poll_freq=poll_freq)
+            poll_freq=self.poll_freq)
 
     def get_link_href(self) -> str:
         """
@@ -36,7 +42,73 @@ class Link(BasicPerspectiveComponent):
         page URLs which would be appended to the Gateway address (including port) to fashion a full URL, though
         the actual navigation is done internally instead of through an HTTP GET request.
         """
-        return self._anchor.find().get_attribute('href')
+        return self.get_link_properties()['href']
+
+    def get_link_properties(self) -> dict:
+        """
+        Obtain the href and target of the Link in one script call, instead of one attribute command per property.
+
+        :returns: A dictionary with 'href' and 'target' keys.
+        """
+        return self.driver.execute_script(
+            'return {href: arguments[0].href, target: arguments[0].target};', self._anchor.find())
+
+    @staticmethod
+    def collect_hrefs(links: List["Link"]) -> List[Optional[str]]:
+        """
+        Collect the href of every supplied Link in a single script call, instead of one attribute command per Link.
+        A WebDriver session serializes its commands, so concurrent reads would not overlap the round trips;
+        batching the reads in-browser achieves the latency win safely.
+
+        :param links: The Link components whose hrefs should be collected. All must share one driver.
+
+        :returns: The href of each supplied Link, in order, with None for any Link not currently in the DOM.
+        """
+        if not links:
+            return []
+        return links[0].driver.execute_script(
+            'return arguments[0].map(function(s) {'
+            '    const anchor = document.querySelector(s);'
+            '    return anchor ? anchor.href : null;'
+            '});',
+            [f'{link.get_full_css_locator()[1]} a' for link in links])
+
+    @staticmethod
+    def all_hrefs_under(driver: WebDriver, parent_css_selector: str) -> List[Tuple[str, str]]:
+        """
+        Obtain the href and target of every anchor beneath a parent container in one script call, instead of
+        locating and querying each Link individually.
+
+        :param driver: The WebDriver used to drive the session/page.
+        :param parent_css_selector: The CSS selector of the container whose anchors should be collected.
+
+        :returns: A list of (href, target) tuples, in document order.
+        """
+        return [
+            tuple(pair) for pair in driver.execute_script(
+                'return Array.from(document.querySelectorAll(arguments[0] + " a"))'
+                '.map(function(a) { return [a.href, a.target]; });',
+                parent_css_selector)]
+
+    def get_state(self) -> dict:
+        """
+        Obtain a snapshot of the anchor: its href, target, text, and displayed state, hydrated in one script call
+        and cached until :func:`invalidate_state` is called. Use this when reading several properties of a Link
+        whose DOM is not expected to change between reads.
+
+        :returns: A dictionary with 'href', 'target', 'text', and 'visible' keys.
+        """
+        if self._state is None:
+            self._state = self.driver.execute_script(
+                'const el = arguments[0];'
+                'return {href: el.href, target: el.target, text: el.textContent,'
+                ' visible: el.getClientRects().length > 0};',
+                self._anchor.find())
+        return self._state
+
+    def invalidate_state(self) -> None:
+        """Discard any snapshot held by :func:`get_state`, forcing the next read to query the DOM again."""
+        self._state = None
 
     def get_target(self) -> str:
         """
@@ -45,4 +117,4 @@ class Link(BasicPerspectiveComponent):
         _blank - The destination specified within the href attribute will be opened in a new browser tab.
         All other values would open in the same browser tab.
         """
-        return self._anchor.find().get_attribute('target')
+        return self.get_link_properties()['target']
@@ -0,0 +1,74 @@
+from time import monotonic, sleep
+from typing import Callable
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+
+
+class AdaptiveWait(WebDriverWait):
+    """
+    A WebDriverWait which polls the DOM with exponential backoff instead of a fixed interval. Polling begins at a
+    short interval (50ms) and doubles after every unsuccessful check, capped at the poll frequency supplied during
+    construction. Conditions which resolve quickly are therefore seen almost immediately, instead of only after the
+    full fixed poll interval has elapsed, while slow conditions degrade to the supplied poll frequency.
+    """
+    _INITIAL_POLL_FREQUENCY = 0.05
+
+    def until(self, method: Callable, message: str = ""):
+        """
+        Poll the DOM with the supplied method until it returns a truthy value, backing off exponentially between
+        checks.
+
+        :param method: A callable which accepts the WebDriver of the session and returns a truthy value once the
+            condition is met.
+        :param message: The message to attach to any raised TimeoutException.
+
+        :returns: The first truthy value returned by the supplied method.
+
+        :raises TimeoutException: If the supplied method never returns a truthy value.
+        """
+        screen = None
+        stacktrace = None
+        poll = min(self._INITIAL_POLL_FREQUENCY, self._poll) if self._poll else self._INITIAL_POLL_FREQUENCY
+        end_time = monotonic() + self._timeout
+        while True:
+            try:
+                value = method(self._driver)
+                if value:
+                    return value
+            except self._ignored_exceptions as exc:
+                screen = getattr(exc, "screen", None)
+                stacktrace = getattr(exc, "stacktrace", None)
+            if monotonic() > end_time:
+                break
+            sleep(poll)
+            poll = min(poll * 2, self._poll) if self._poll else poll
+        raise TimeoutException(message, screen, stacktrace)
+
+    def until_not(self, method: Callable, message: str = ""):
+        """
+        Poll the DOM with the supplied method until it returns a falsy value, backing off exponentially between
+        checks.
+
+        :param method: A callable which accepts the WebDriver of the session and returns a falsy value once the
+            condition is no longer met.
+        :param message: The message to attach to any raised TimeoutException.
+
+        :returns: The first falsy value returned by the supplied method.
+
+        :raises TimeoutException: If the supplied method never returns a falsy value.
+        """
+        poll = min(self._INITIAL_POLL_FREQUENCY, self._poll) if self._poll else self._INITIAL_POLL_FREQUENCY
+        end_time = monotonic() + self._timeout
+        while True:
+            try:
+                value = method(self._driver)
+                if not value:
+                    return value
+            except self._ignored_exceptions:
+                return True
+            if monotonic() > end_time:
+                break
+            sleep(poll)
+            poll = min(poll * 2, self._poll) if self._poll else poll
+        raise TimeoutException(message)
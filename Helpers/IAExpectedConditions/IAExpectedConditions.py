@@ -331,10 +331,8 @@ class element_is_fully_in_viewport(object):
         self.locator = locator
 
     def __call__(self, driver):
-        _rect = self.driver.find_element(*self.locator).rect
-        _viewport_height = self.driver.execute_script('return window.innerHeight')
-        _viewport_width = self.driver.execute_script('return window.innerWidth')
-        return (_rect['x'] >= 0) and \
-               (_rect['x'] + _rect['width'] <= _viewport_width) and \
-               (_rect['y'] >= 0) and \
-               (_rect['y'] + _rect['height'] <= _viewport_height)
+        # One script invocation in place of separate rect/innerHeight/innerWidth round-trips.
+        return self.driver.execute_script(
+            'const r = arguments[0].getBoundingClientRect();'
+            'return r.left >= 0 && r.right <= window.innerWidth && r.top >= 0 && r.bottom <= window.innerHeight;',
+            self.driver.find_element(*self.locator))
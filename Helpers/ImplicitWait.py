@@ -0,0 +1,26 @@
+from contextlib import contextmanager
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+
+@contextmanager
+def scoped_zero_implicit(driver: WebDriver):
+    """
+    Temporarily disable any implicit wait configured on the supplied driver, restoring the previous value on exit.
+
+    This library polls with explicit waits and never configures an implicit wait itself, but drivers supplied by
+    consuming projects sometimes arrive with one set. An implicit wait stacks on top of every negative-path probe
+    (a presence check for an element which is expected to be absent), inflating each miss by the full implicit
+    timeout. Wrap such probes in this context manager to keep the miss path fast without permanently altering the
+    driver configuration.
+
+    Example:
+        with scoped_zero_implicit(driver=driver):
+            elements = driver.find_elements(*locator)
+    """
+    previous = driver.timeouts.implicit_wait
+    driver.implicitly_wait(0)
+    try:
+        yield
+    finally:
+        driver.implicitly_wait(previous)